@@ -56,6 +56,7 @@ def iterate_and_print(
         else:
             write_azure_devops_items(item_group, config, level + 1)
         config.output.write("</div>\n\n")
+        config.output.flush()
 
 
 def write_github_items(item_group: WorkItemGroup, config: Config):
@@ -88,10 +89,12 @@ def write_type_header(
     else:
         icon_url = AZURE_ICONS.get(wi.type, AZURE_ICONS["Other"])
     icon_html = get_icon_html(icon_url, f"{wi.type} Icon", 20)
-    config.output.write(f"<a id='{wi.type.lower().replace(' ', '-')}s'></a>\n\n")
-    header = f"{'#' * level} {icon_html} {wi.type}s\n\n"
-    config.output.write(header)
-    config.output.write("<div style='margin-left:1em'>\n\n")
+    anchor = wi.type.lower().replace(" ", "-")
+    config.output.write(
+        f"<a id='{anchor}s'></a>\n\n"
+        f"{'#' * level} {icon_html} {wi.type}s\n\n"
+        "<div style='margin-left:1em'>\n\n"
+    )
 
 
 def write_commit_items(
@@ -107,14 +110,14 @@ def write_commit_items(
     """
     log.info(f"Processing {len(item_group.items)} commits")
     for commit in item_group.items:
-        log.debug(f"Processing commit: {commit}")
+        log.debug("Processing commit: %s", commit)
         if isinstance(commit, HierarchicalWorkItem) and hasattr(commit, "sha"):
             sha = commit.sha[:7] if commit.sha else "Unknown"
             title = commit.title if commit.title else ""
             url = commit.url if commit.url else "#"
             icon_html = get_icon_html(GITHUB_ICONS["Commit"], "Commit Icon")
             output_line = f"{icon_html} [{sha}]({url}) {title}\n"
-            log.debug(f"Writing commit line: {output_line}")
+            log.debug("Writing commit line: %s", output_line)
             config.output.write(output_line)
         else:
             log.warning(f"Skipping invalid commit item: {commit}")
@@ -142,24 +145,26 @@ def write_azure_devops_item(
     config: Config,
     level: int,
 ):
-    """Write an Azure DevOps work item."""
-    type_str = wi.type if wi.type is not None else "Unknown"
-    icon_url = AZURE_ICONS.get(type_str, AZURE_ICONS["Other"])
-    icon_html = get_icon_html(icon_url, f"{type_str} Icon", 20 - level)
-    id_str = f"#{wi.id}" if wi.id is not None else ""
-    title = wi.title if wi.title is not None else ""
-    url = wi.url if wi.url is not None else "#"
-    summary = wi.summary if wi.summary is not None else ""
+    """Write an Azure DevOps work item followed by its descendants, depth first."""
+    stack = [(wi, level)]
+    while stack:
+        item, item_level = stack.pop()
+        type_str = item.type if item.type is not None else "Unknown"
+        icon_url = AZURE_ICONS.get(type_str, AZURE_ICONS["Other"])
+        icon_html = get_icon_html(icon_url, f"{type_str} Icon", 20 - item_level)
+        id_str = f"#{item.id}" if item.id is not None else ""
+        title = item.title if item.title is not None else ""
+        url = item.url if item.url is not None else "#"
+        summary = item.summary if item.summary is not None else ""
 
-    header = f"{'#' * level} {icon_html} [{id_str}]({url}) {title}\n\n"
-    config.output.write(header)
+        header = f"{'#' * item_level} {icon_html} [{id_str}]({url}) {title}\n\n"
+        config.output.write(header)
 
-    if summary:
-        config.output.write(f"{summary}\n\n")
+        if summary:
+            config.output.write(f"{summary}\n\n")
 
-    if wi.children:
-        for child in wi.children:
-            write_azure_devops_item(child, config, level + 1)
+        # Push children in reverse so they are written in their original order
+        stack.extend((child, item_level + 1) for child in reversed(item.children))
 
 
 async def finalise_notes(work: Work, config: Config) -> None:
@@ -177,31 +182,31 @@ async def finalise_notes(work: Work, config: Config) -> None:
 async def main():
     """Main function to generate the changelog."""
     log.info("Starting changelog generation process")
-    overall_start_time = time.time()
+    overall_start_time = time.perf_counter()
     config = Config()
     if not config.valid_env:
         log.error("Invalid environment configuration")
         sys.exit(1)
     work = Work(config)
     try:
-        init_start_time = time.time()
+        init_start_time = time.perf_counter()
         await work.initialize()
-        init_end_time = time.time()
+        init_end_time = time.perf_counter()
         log.info(
             "Work initialization completed in %.2f seconds",
             init_end_time - init_start_time,
         )
         log.info("Generating and printing ordered work items")
-        items_start_time = time.time()
+        items_start_time = time.perf_counter()
         items_by_type = await work.generate_ordered_work_items()
         iterate_and_print(items_by_type, config)
         await finalise_notes(work, config)
-        items_end_time = time.time()
+        items_end_time = time.perf_counter()
         log.info(
             "Generated and printed ordered work items in %.2f seconds",
             items_end_time - items_start_time,
         )
-        overall_end_time = time.time()
+        overall_end_time = time.perf_counter()
         log.info(
             "Total changelog generation time: %.2f seconds",
             overall_end_time - overall_start_time,
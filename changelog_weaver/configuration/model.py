@@ -1,6 +1,10 @@
 """ This module contains the Model class for the GPT model."""
 
+import asyncio
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict
 
 # Third party imports
 import openai
@@ -11,6 +15,9 @@ from ..logger import get_logger
 
 log = get_logger(__name__)
 
+# Upper bound on model requests in flight at once, to stay under provider rate limits
+MAX_CONCURRENT_REQUESTS = 8
+
 
 class Model:
     """
@@ -37,12 +44,20 @@ class Model:
         self.api_details = api_details
         self.item_summary = item_summary
         self.changelog_summary = changelog_summary
+        # Requests by prompt, in flight or done, so identical prompts are only sent once
+        self._responses: Dict[str, asyncio.Future] = {}
+        # The OpenAI client is blocking, requests run here so summaries overlap
+        self.executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS)
         log.info("Model initialized: %s", self.api_details.model_name)
         if self.authenticate():
             log.info("Model authenticated successfully")
         else:
             log.error("Model authentication failed")
 
+    async def close(self):
+        """Shut down the executor used for model requests."""
+        self.executor.shutdown(wait=True)
+
     async def summarise(self, prompt: str) -> str:
         """
         Sends a prompt to GPT and returns the response.
@@ -54,7 +69,13 @@ class Model:
             str: The response generated by GPT.
         """
 
-        return await self._openai_request(prompt)
+        response = self._responses.get(prompt)
+        if response is None:
+            response = asyncio.ensure_future(self._openai_request(prompt))
+            self._responses[prompt] = response
+        else:
+            log.debug("Using cached response for prompt")
+        return await response
 
     def authenticate(self):
         """
@@ -76,16 +97,23 @@ class Model:
             return False
 
     async def _openai_request(self, prompt: str) -> str:
+        loop = asyncio.get_event_loop()
         try:
-            response = self.client.chat.completions.create(
-                model=self.api_details.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                stream=False,
-                logprobs=False,
+            response = await loop.run_in_executor(
+                self.executor,
+                partial(
+                    self.client.chat.completions.create,
+                    model=self.api_details.model_name,
+                    messages=[{"role": "user", "content": prompt}],
+                    stream=False,
+                    logprobs=False,
+                ),
             )
             return str(response.choices[0].message.content)
         except openai.APIError as e:
             log.error("OpenAI Error: %s", str(e))
+            # Drop the failed request so the prompt is sent again next time
+            self._responses.pop(prompt, None)
             return f"Error: {str(e)}"
 
     def count_tokens(self, text: str) -> int:
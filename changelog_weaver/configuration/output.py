@@ -2,6 +2,7 @@
 
 from pathlib import Path
 import re
+from typing import List
 import markdown
 
 
@@ -22,6 +23,8 @@ class Output:
         self.md = True
         self.html = False
         self.pdf = False
+        # Content written since the last flush, appended to the file in one go
+        self._buffer: List[str] = []
         self.setup_file(folder, name, version)
 
     def setup_file(self, folder: str, name: str, version: str):
@@ -48,26 +51,35 @@ class Output:
         Args:
             name (str): The name of the software.
             version (str): The version of the software."""
-        try:
-            self.write(
-                f"# Release Notes for {name} version v{version}\n\n"
-                f"<TABLEOFCONTENTS>\n\n"
-                f"## Summary\n\n"
-                f"<NOTESSUMMARY>\n\n"
-            )
-        except (FileNotFoundError, PermissionError) as e:
-            log.error("Error occurred while setting up initial content: %s", e)
+        self.write(
+            f"# Release Notes for {name} version v{version}\n\n"
+            f"<TABLEOFCONTENTS>\n\n"
+            f"## Summary\n\n"
+            f"<NOTESSUMMARY>\n\n"
+        )
+        self.flush()
 
     def write(self, content: str):
-        """Write content to the output file.
+        """Write content to the output file. Content is buffered until flush().
 
         Args:
             content (str): The content to write."""
-        with open(self.path, "a", encoding="utf-8") as file_output:
-            file_output.write(content)
+        self._buffer.append(content)
+
+    def flush(self):
+        """Append any buffered content to the output file."""
+        if not self._buffer:
+            return
+        try:
+            with open(self.path, "a", encoding="utf-8") as file_output:
+                file_output.write("".join(self._buffer))
+        except (FileNotFoundError, PermissionError) as e:
+            log.error("Error occurred while writing to output file: %s", e)
+        self._buffer.clear()
 
     def read(self) -> str:
         """Read the content of the output file."""
+        self.flush()
         with open(self.path, "r", encoding="utf-8") as file:
             return file.read()
 
@@ -3,6 +3,7 @@
 import asyncio
 import time
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import List, Dict, Optional
 import aiohttp
 from azure.devops.v7_1.work_item_tracking.models import (
@@ -33,6 +34,9 @@ FIELDS = [
     "Microsoft.VSTS.Scheduling.StoryPoints",
 ]
 
+# Maximum number of IDs the work items batch endpoint accepts per request
+BATCH_SIZE = 200
+
 
 # pylint: disable=too-many-instance-attributes
 class DevOpsAPI:
@@ -174,7 +178,7 @@ class DevOpsAPI:
 
     async def get_work_items_from_query(self, query_id: str) -> List[WorkItem]:
         """Get work items from a query"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         log.info("Starting to fetch work items from query %s", query_id)
 
         loop = asyncio.get_event_loop()
@@ -187,7 +191,7 @@ class DevOpsAPI:
 
         items = await self.get_work_items(work_item_ids)
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         duration = end_time - start_time
         log.info(
             "Finished fetching %s work items in %.2f seconds", len(items), duration
@@ -211,6 +215,32 @@ class DevOpsAPI:
         )
         return await self._convert_to_work_item(azure_work_item)
 
+    async def get_work_items_by_ids(self, item_ids: List[int]) -> List[WorkItem]:
+        """Get work items by ID using the batch endpoint, omitting missing items"""
+        loop = asyncio.get_event_loop()
+        batches = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self.executor,
+                    partial(
+                        self.wit_client.get_work_items,
+                        item_ids[i : i + BATCH_SIZE],
+                        expand="All",
+                        error_policy="Omit",
+                    ),
+                )
+                for i in range(0, len(item_ids), BATCH_SIZE)
+            )
+        )
+        return await asyncio.gather(
+            *(
+                self._convert_to_work_item(azure_work_item)
+                for batch in batches
+                for azure_work_item in batch
+                if azure_work_item is not None
+            )
+        )
+
     async def get_work_items_from_wiql(self, wiql: str) -> List[WorkItem]:
         """Get work items from a WIQL query"""
         loop = asyncio.get_event_loop()
@@ -223,13 +253,12 @@ class DevOpsAPI:
 
     async def get_work_items(self, work_item_ids: List[int]) -> List[WorkItem]:
         """Get work items by ID"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         log.info("Starting to fetch details for %s work items", len(work_item_ids))
 
-        tasks = [self.get_work_item_by_id(item_id) for item_id in work_item_ids]
-        items = await asyncio.gather(*tasks)
+        items = await self.get_work_items_by_ids(work_item_ids)
 
-        end_time = time.time()
+        end_time = time.perf_counter()
         duration = end_time - start_time
         log.info(
             "Finished fetching details for %s work items in %.2f seconds",
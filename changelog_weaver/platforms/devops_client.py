@@ -49,6 +49,9 @@ class DevOpsPlatformClient(PlatformClient):
     async def get_work_item_by_id(self, item_id: int) -> WorkItem:
         return await self.api.get_work_item_by_id(item_id)
 
+    async def get_work_items_by_ids(self, item_ids: List[int]) -> List[WorkItem]:
+        return await self.api.get_work_items_by_ids(item_ids)
+
     async def get_work_items_from_query(self, query_id: str) -> List[WorkItem]:
         return await self.api.get_work_items_from_query(query_id)
 
@@ -1,8 +1,12 @@
 """GitHub API module for interacting with GitHub issues and pull requests."""
 
-from typing import List, Optional, Dict, Union, Tuple
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional, Dict, Union, Tuple
 from datetime import datetime
-from github import Github
+from github import Github, UnknownObjectException
 from github.Issue import Issue
 from github.PullRequest import PullRequest
 from github.Repository import Repository
@@ -14,6 +18,7 @@ from ..logger import get_logger
 log = get_logger(__name__)
 
 
+# pylint: disable=too-many-instance-attributes
 class GitHubAPI:
     """Class for interacting with the GitHub API."""
 
@@ -30,14 +35,24 @@ class GitHubAPI:
             f"from_tag: {self.from_tag}, to_tag: {self.to_tag}"
         )
         self.issue_types: Dict[str, WorkItemType] = {}
+        self.executor = ThreadPoolExecutor(max_workers=5)
 
     async def initialize(self):
         """Initialize the API by fetching issue types."""
         await self.fetch_issue_types()
 
+    async def close(self):
+        """Close the API client"""
+        self.executor.shutdown(wait=True)
+
+    async def _run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking PyGithub call in the executor so it doesn't stall the event loop."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
     async def fetch_issue_types(self):
         """Fetch and store issue types from the repository."""
-        labels = self.repo.get_labels()
+        labels = await self._run(lambda: list(self.repo.get_labels()))
         self.issue_types = {
             label.name: self._convert_label_to_work_item_type(label) for label in labels
         }
@@ -81,30 +96,22 @@ class GitHubAPI:
         if from_tag and to_tag:
             log.info(f"Filtering commits between tags: {from_tag} and {to_tag}")
 
-            try:
-                # Fetch all tags
-                tags = self.repo.get_tags()
-                tag_dict = {tag.name: tag.commit.sha for tag in tags}
-
-                # Get commit SHAs for the tags
-                from_commit = tag_dict.get(from_tag)
-                to_commit = tag_dict.get(to_tag)
-
-                if not from_commit or not to_commit:
-                    missing_tag = from_tag if not from_commit else to_tag
-                    log.error(f"Tag not found: {missing_tag}")
-                    return []
+            commit_range = await self._get_commit_range(from_tag, to_tag)
+            if not commit_range:
+                return []
+            from_commit, to_commit = commit_range
 
-                log.info(f"From commit SHA: {from_commit}")
-                log.info(f"To commit SHA: {to_commit}")
+            log.info(f"From commit SHA: {from_commit}")
+            log.info(f"To commit SHA: {to_commit}")
 
+            try:
                 # Get the comparison
-                comparison = self.repo.compare(from_commit, to_commit)
+                comparison = await self._run(self.repo.compare, from_commit, to_commit)
 
                 log.info(f"Found {comparison.total_commits} commits between tags")
 
                 # No need to filter by branch as comparison is between specified commits
-                commits_list = list(comparison.commits)
+                commits_list = await self._run(lambda: list(comparison.commits))
                 # Reverse the commits list to have the most recent commits first
                 commits_list.reverse()
                 return [
@@ -117,7 +124,7 @@ class GitHubAPI:
                 return []
 
         # If no tags specified or tag filtering failed, get commits normally
-        commits = self.repo.get_commits(**kwargs)
+        commits = await self._run(lambda: list(self.repo.get_commits(**kwargs)))
         return [await self._convert_to_commit_info(commit) for commit in commits]
 
     async def _get_commit_range(
@@ -137,20 +144,36 @@ class GitHubAPI:
             return None
 
         try:
-            from_ref = self.repo.get_git_ref(f"tags/{from_tag}")
-            to_ref = self.repo.get_git_ref(f"tags/{to_tag}")
-
-            # Get the commit SHA for each tag
-            from_sha = from_ref.object.sha
-            to_sha = to_ref.object.sha
-
+            from_sha, to_sha = await asyncio.gather(
+                self._resolve_tag_sha(from_tag), self._resolve_tag_sha(to_tag)
+            )
             return (from_sha, to_sha)
         except Exception as e:
-            log.warning(
+            log.error(
                 f"Error getting commit range for tags {from_tag} to {to_tag}: {str(e)}"
             )
             return None
 
+    async def _resolve_tag_sha(self, tag: str) -> str:
+        """
+        Resolve a tag name to the SHA of the commit it points at.
+
+        Only the ref for the given tag is requested, rather than listing every
+        tag in the repository. Annotated tags point at a tag object, which is
+        dereferenced once to reach the underlying commit.
+
+        Args:
+            tag (str): The tag name.
+
+        Returns:
+            str: The commit SHA the tag refers to.
+        """
+        ref = await self._run(self.repo.get_git_ref, f"tags/{tag}")
+        if ref.object.type == "tag":
+            tag_object = await self._run(self.repo.get_git_tag, ref.object.sha)
+            return tag_object.object.sha
+        return ref.object.sha
+
     def _is_commit_in_range(self, commit_sha: str, from_sha: str, to_sha: str) -> bool:
         """
         Check if a commit is within the specified range.
@@ -184,10 +207,11 @@ class GitHubAPI:
         Returns:
             CommitInfo: The converted CommitInfo object.
         """
+        author = commit.commit.author.name
         return CommitInfo(
             sha=str(commit.sha),  # Explicitly convert to string
             message=commit.commit.message.split("\n")[0],  # Only take the first line
-            author=commit.commit.author.name,
+            author=author and sys.intern(author),
             date=format_date(commit.commit.author.date),
             url=commit.html_url,
         )
@@ -202,34 +226,72 @@ class GitHubAPI:
 
     async def get_issues_from_query(self, query: str) -> List[WorkItem]:
         """Get issues based on a query string."""
-        issues_and_prs = self.client.search_issues(
-            query=f"repo:{self.config.repo_name} {query}"
+        issues_and_prs = await self._run(
+            lambda: list(
+                self.client.search_issues(query=f"repo:{self.config.repo_name} {query}")
+            )
         )
         return [await self._convert_to_work_item(item) for item in issues_and_prs]
 
     async def get_issue_by_number(self, issue_number: int) -> WorkItem:
         """Get a specific issue by its number."""
-        issue = self.repo.get_issue(number=issue_number)
+        issue = await self._run(self.repo.get_issue, number=issue_number)
         return await self._convert_to_work_item(issue)
 
+    async def get_issues_by_numbers(self, issue_numbers: List[int]) -> List[WorkItem]:
+        """Get several issues by number concurrently, skipping any that do not exist."""
+
+        async def get_issue(issue_number: int) -> Optional[WorkItem]:
+            try:
+                return await self.get_issue_by_number(issue_number)
+            except UnknownObjectException:
+                log.warning("Issue %s not found", issue_number)
+                return None
+
+        issues = await asyncio.gather(*(get_issue(number) for number in issue_numbers))
+        return [issue for issue in issues if issue is not None]
+
     async def get_issues_with_details(
         self, state: str = "all", labels: Optional[List[str]] = None
     ) -> List[WorkItem]:
         """Get issues with additional details."""
-        issues = self.repo.get_issues(state=state, labels=labels or [])
+        issues = await self._run(
+            lambda: list(self.repo.get_issues(state=state, labels=labels or []))
+        )
         return [await self._convert_to_work_item(issue) for issue in issues]
 
-    async def get_pull_requests(self, state: str = "all") -> List[WorkItem]:
-        """Get pull requests from the repository."""
-        pull_requests = self.repo.get_pulls(
-            state=state, sort="created", direction="desc"
+    async def _fetch_issues_and_prs(
+        self, state: str = "all", labels: Optional[List[str]] = None
+    ) -> Tuple[List[WorkItem], List[WorkItem]]:
+        """
+        Fetch issues and pull requests with a single listing of the issues endpoint.
+
+        GitHub's issues endpoint returns pull requests as well, so one listing is
+        partitioned locally instead of also paging through the pulls endpoint.
+
+        Args:
+            state (str): The state of the items to fetch.
+            labels (Optional[List[str]]): Labels to filter the items by.
+
+        Returns:
+            Tuple[List[WorkItem], List[WorkItem]]: The issues and the pull requests.
+        """
+        rows = await self._run(
+            lambda: list(self.repo.get_issues(state=state, labels=labels or []))
         )
-        return [await self._convert_to_work_item(pr) for pr in pull_requests]
+        issues: List[WorkItem] = []
+        pull_requests: List[WorkItem] = []
+        for row in rows:
+            item = await self._convert_to_work_item(row)
+            if self._is_pull_request(row):
+                pull_requests.append(item)
+            else:
+                issues.append(item)
+        return issues, pull_requests
 
     async def get_all_work_items(self, **kwargs) -> List[HierarchicalWorkItem]:
         """Get all work items including issues and pull requests."""
-        issues = await self.get_issues_with_details(**kwargs)
-        pull_requests = await self.get_pull_requests(**kwargs)
+        issues, pull_requests = await self._fetch_issues_and_prs(**kwargs)
 
         issues_root = HierarchicalWorkItem(
             id=-1,
@@ -239,11 +301,7 @@ class GitHubAPI:
             icon="https://github.githubassets.com/images/modules/logos_page/Octocat.png",
             root=True,
             orphan=False,
-            children=[
-                HierarchicalWorkItem(**issue.__dict__)
-                for issue in issues
-                if not hasattr(issue, "pull_request")
-            ],
+            children=[HierarchicalWorkItem.from_work_item(issue) for issue in issues],
         )
         prs_root = HierarchicalWorkItem(
             id=-2,
@@ -253,24 +311,32 @@ class GitHubAPI:
             icon="https://github.githubassets.com/images/modules/git-pull-request.svg",
             root=True,
             orphan=False,
-            children=[HierarchicalWorkItem(**pr.__dict__) for pr in pull_requests],
+            children=[HierarchicalWorkItem.from_work_item(pr) for pr in pull_requests],
         )
 
         return [issues_root, prs_root]
 
+    @staticmethod
+    def _is_pull_request(github_item: Union[Issue, PullRequest]) -> bool:
+        """
+        Check whether a GitHub item is a pull request.
+
+        Issues listed from the issues endpoint only carry a pull_request field when
+        they are pull requests, and reading the missing field makes PyGithub fetch
+        the whole issue again. The html_url is always present, so use that instead.
+        """
+        return isinstance(github_item, PullRequest) or "/pull/" in github_item.html_url
+
     async def _convert_to_work_item(
         self, github_item: Union[Issue, PullRequest]
     ) -> WorkItem:
         """Convert a GitHub issue or pull request to a WorkItem."""
-        item_type = (
-            "PullRequest"
-            if isinstance(github_item, PullRequest)
-            or hasattr(github_item, "pull_request")
-            else "Issue"
-        )
-        labels = [label.name for label in github_item.labels]
+        item_type = "PullRequest" if self._is_pull_request(github_item) else "Issue"
+        # Intern label names so recurring labels share one string object
+        labels = [sys.intern(label.name) for label in github_item.labels]
         primary_label = labels[0] if labels else "Other"
         issue_type_info = self.get_issue_type(primary_label)
+        comment_count = github_item.comments
         return WorkItem(
             id=github_item.number,
             root=False,
@@ -279,16 +345,22 @@ class GitHubAPI:
             state=github_item.state,
             type=item_type,
             icon=issue_type_info.icon if issue_type_info else "",
-            comment_count=github_item.comments,
+            comment_count=comment_count,
             description=clean_string(github_item.body or "", 10),
             tags=labels,
             url=github_item.html_url,
-            comments=await self._get_comments(github_item),
+            comments=await self._get_comments(github_item, comment_count),
         )
 
-    async def _get_comments(self, github_item: Union[Issue, PullRequest]) -> List[str]:
+    async def _get_comments(
+        self, github_item: Union[Issue, PullRequest], comment_count: int
+    ) -> List[str]:
         """Get comments for a GitHub issue or pull request."""
+        if not comment_count:
+            # Nothing to fetch, skip the comments request entirely
+            return []
+        comments = await self._run(lambda: list(github_item.get_comments()))
         return [
             f"{format_date(comment.created_at)} | {comment.user.login} | {clean_string(comment.body, 10)}"
-            for comment in github_item.get_comments()
+            for comment in comments
         ]
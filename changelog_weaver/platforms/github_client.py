@@ -34,12 +34,15 @@ class GitHubPlatformClient(PlatformClient):
         await self.api.initialize()
 
     async def close(self):
-        # GitHub API doesn't require explicit closing
-        pass
+        """Close the API client."""
+        await self.api.close()
 
     async def get_work_item_by_id(self, item_id: int) -> WorkItem:
         return await self.api.get_issue_by_number(item_id)
 
+    async def get_work_items_by_ids(self, item_ids: List[int]) -> List[WorkItem]:
+        return await self.api.get_issues_by_numbers(item_ids)
+
     async def get_work_items_from_query(self, query_id: str) -> List[WorkItem]:
         return await self.api.get_issues_from_query(query_id)
 
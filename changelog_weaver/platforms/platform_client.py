@@ -20,6 +20,10 @@ class PlatformClient(ABC):
     async def get_work_item_by_id(self, item_id: int) -> WorkItem:
         """Get a work item by its ID."""
 
+    @abstractmethod
+    async def get_work_items_by_ids(self, item_ids: List[int]) -> List[WorkItem]:
+        """Get several work items by their IDs, skipping any that do not exist."""
+
     @abstractmethod
     async def get_work_items_from_query(self, query_id: str) -> List[WorkItem]:
         """Get work items from a query."""
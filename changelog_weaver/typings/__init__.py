@@ -10,7 +10,6 @@ from .base_types import (
 )
 from .complex_types import (
     HierarchicalWorkItem,
-    PlatformInfo,
     Notes,
     Project,
     WorkItemGroup,
@@ -1,9 +1,13 @@
 """ Base types for the changelog_weaver package. """
 
+import sys
 from typing import List, Optional
 from enum import Enum
 from dataclasses import dataclass, field
 
+# Slotted dataclasses need Python 3.10+, older interpreters keep a per-instance __dict__
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass
 class ApiDetails:
@@ -32,7 +36,7 @@ class Platform(Enum):
     GITHUB = "github"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class WorkItemType:
     """Dataclass for work item types"""
 
@@ -42,7 +46,7 @@ class WorkItemType:
 
 
 # pylint: disable=too-many-instance-attributes
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class WorkItem:
     """Dataclass for work items"""
 
@@ -54,7 +58,8 @@ class WorkItem:
     root: bool
     orphan: bool
     parent_id: int = 0
-    parent: Optional["WorkItem"] = None
+    # Graph fields are excluded from __eq__ so comparisons don't recurse through the tree
+    parent: Optional["WorkItem"] = field(default=None, compare=False, repr=False)
     comment_count: int = 0
     story_points: Optional[int] = None
     summary: Optional[str] = None
@@ -69,8 +74,13 @@ class WorkItem:
     date: Optional[str] = None
     comments: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Type and icon are grouping keys; interning shares one object per value
+        self.type = sys.intern(self.type)
+        self.icon = sys.intern(self.icon)
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class PlatformInfo:
     """Represents the platform information."""
 
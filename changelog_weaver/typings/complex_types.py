@@ -1,20 +1,39 @@
 """ Complex types used in the project. """
 
 from typing import List, TypeVar, Generic
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 
-from .base_types import WorkItem, PlatformInfo
+from .base_types import DATACLASS_OPTIONS, WorkItem, PlatformInfo
 
+_WORK_ITEM_FIELDS = tuple(f.name for f in fields(WorkItem))
 
-@dataclass
+
+@dataclass(**DATACLASS_OPTIONS)
 class HierarchicalWorkItem(WorkItem):
     """Represents a work item with children."""
 
-    children: List["HierarchicalWorkItem"] = field(default_factory=list)
-    children_by_type: List["WorkItemGroup"] = field(default_factory=list)
+    children: List["HierarchicalWorkItem"] = field(default_factory=list, compare=False)
+    # Regroups children, so it is left out of the repr to avoid listing items twice
+    children_by_type: List["WorkItemGroup"] = field(
+        default_factory=list, compare=False, repr=False
+    )
+
+    @classmethod
+    def from_work_item(cls, work_item: WorkItem) -> "HierarchicalWorkItem":
+        """Create a hierarchical work item carrying over the fields of a work item,
+        including its children when it is already hierarchical."""
+        names = (
+            _HIERARCHICAL_WORK_ITEM_FIELDS
+            if isinstance(work_item, HierarchicalWorkItem)
+            else _WORK_ITEM_FIELDS
+        )
+        return cls(**{name: getattr(work_item, name) for name in names})
+
+
+_HIERARCHICAL_WORK_ITEM_FIELDS = tuple(f.name for f in fields(HierarchicalWorkItem))
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Notes:
     """Represents the notes for a project."""
 
@@ -22,7 +41,7 @@ class Notes:
     headers: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Project:
     """ " Represents a project."""
 
@@ -38,12 +57,10 @@ class Project:
 T = TypeVar("T", WorkItem, "HierarchicalWorkItem")
 
 
-@dataclass
-# pylint: disable=redefined-builtin
+@dataclass(**DATACLASS_OPTIONS)
 class WorkItemGroup(Generic[T]):
     """Represents a group of work items."""
 
-    def __init__(self, type: str, icon: str, items: List[T]):
-        self.type = type
-        self.icon = icon
-        self.items: List[T] = items
+    type: str
+    icon: str
+    items: List[T]
@@ -1,8 +1,5 @@
 """ Enum for supported platforms. """
 
-from enum import Enum
+from .base_types import Platform
 
-class Platform(Enum):
-    """ Enum for supported platforms."""
-    AZURE_DEVOPS = "azure_devops"
-    GITHUB = "github"
+__all__ = ["Platform"]
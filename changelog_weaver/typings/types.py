@@ -3,9 +3,10 @@
 from dataclasses import dataclass
 
 from ..utilities import clean_string, format_date, clean_name
+from .base_types import DATACLASS_OPTIONS
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class User:
     """Represents a user."""
 
@@ -21,7 +22,7 @@ class User:
         self.unique_name = unique_name
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Comment:
     """Represents a comment on a work item."""
 
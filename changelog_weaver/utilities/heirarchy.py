@@ -1,6 +1,7 @@
 """ Module for handling the hierarchy of work items. """
 
-from typing import Dict, List, Set
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, Set
 
 from dataclasses import dataclass
 from ..typings import HierarchicalWorkItem, WorkItemGroup
@@ -17,29 +18,38 @@ class Hierarchy:
         self.all: Dict[int, HierarchicalWorkItem] = all_items
         self.root_items: List[HierarchicalWorkItem] = []
         self.by_type: List[WorkItemGroup] = []
+        # Id sets mirroring children and root_items, for constant-time membership checks
+        self._child_ids: DefaultDict[int, Set[int]] = defaultdict(set)
+        self._root_ids: Set[int] = set()
+        for item in all_items.values():
+            if item.children:
+                self._child_ids[item.id].update(child.id for child in item.children)
         self._build_hierarchy()
 
     def _build_hierarchy(self):
         processed_ids: Set[int] = set()
 
-        def process_item(item: HierarchicalWorkItem):
-            if item.id in processed_ids:
-                return
-            processed_ids.add(item.id)
-
-            if item.parent_id and item.parent_id in self.all:
-                parent = self.all[item.parent_id]
-                if item not in parent.children:
-                    parent.children.append(item)
-                process_item(parent)
-            elif not item.orphan and item.id != 0:
-                log.info("Adding root item: %s - %s", item.id, item.title)
-                if item not in self.root_items:
-                    self.root_items.append(item)
-
-        all_items = list(self.all.values())
-        for item in all_items:
-            process_item(item)
+        # Walk each item up its parent chain iteratively, stopping at the first
+        # ancestor that has already been linked. Every item is linked exactly once.
+        for item in self.all.values():
+            current = item
+            while current.id not in processed_ids:
+                processed_ids.add(current.id)
+                parent = self.all.get(current.parent_id) if current.parent_id else None
+                if parent is None:
+                    if (
+                        not current.orphan
+                        and current.id != 0
+                        and current.id not in self._root_ids
+                    ):
+                        self._root_ids.add(current.id)
+                        self.root_items.append(current)
+                    break
+                child_ids = self._child_ids[parent.id]
+                if current.id not in child_ids:
+                    child_ids.add(current.id)
+                    parent.children.append(current)
+                current = parent
 
         # Handle the "Other" parent separately
         other_parent = self.all.get(0)
@@ -47,6 +57,7 @@ class Hierarchy:
             other_parent.children_by_type = self._group_children_by_type(
                 other_parent.children
             )
+            self._root_ids.add(other_parent.id)
             self.root_items.append(other_parent)
 
         # Group children by type for root items (except "Other")
@@ -55,6 +66,11 @@ class Hierarchy:
                 item.children_by_type = self._group_children_by_type(item.children)
 
         self.by_type = self._group_by_type(self.root_items)
+        log.info(
+            "Built hierarchy of %d items with %d root items",
+            len(self.all),
+            len(self.root_items),
+        )
 
     def _group_children_by_type(
         self, children: List[HierarchicalWorkItem]
@@ -62,32 +78,28 @@ class Hierarchy:
         """Group children by their type."""
         type_groups: Dict[str, WorkItemGroup] = {}
         for child in children:
-            if child.type not in type_groups:
-                type_groups[child.type] = WorkItemGroup(
-                    type=child.type, icon=child.icon, items=[]
-                )
-            type_groups[child.type].items.append(child)
+            group = type_groups.get(child.type)
+            if group is None:
+                group = WorkItemGroup(type=child.type, icon=child.icon, items=[])
+                type_groups[child.type] = group
+            group.items.append(child)
         return list(type_groups.values())
 
     def _group_by_type(self, items: List[HierarchicalWorkItem]) -> List[WorkItemGroup]:
         """Group work items by their type while preserving hierarchy."""
         grouped_items: Dict[str, List[HierarchicalWorkItem]] = {}
         for item in items:
-            if item.type not in grouped_items:
-                grouped_items[item.type] = []
-            grouped_items[item.type].append(item)
-
-        grouped_children_list = []
-        for key, value in grouped_items.items():
-            grouped_children_list.append(
-                WorkItemGroup(type=key, icon=value[0].icon, items=value)
-            )
-
-        # Ensure "Other" is always at the end
-        other_items = [item for item in grouped_children_list if item.type == "Other"]
-        non_other_items = [
-            item for item in grouped_children_list if item.type != "Other"
+            group_items = grouped_items.get(item.type)
+            if group_items is None:
+                group_items = grouped_items[item.type] = []
+            group_items.append(item)
+
+        grouped_children_list = [
+            WorkItemGroup(type=key, icon=value[0].icon, items=value)
+            for key, value in grouped_items.items()
         ]
-        grouped_children_list = non_other_items + other_items
+
+        # Ensure "Other" is always at the end, the sort is stable so other groups keep their order
+        grouped_children_list.sort(key=lambda group: group.type == "Other")
 
         return grouped_children_list
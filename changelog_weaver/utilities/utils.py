@@ -3,13 +3,39 @@
 import re
 import datetime
 import json
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 
 from ..logger import get_logger
 
 log = get_logger(__name__)
 
-
+_TAG_RE = re.compile(r"<[^>]*?>")
+_URL_RE = re.compile(r"http[s]?://\S+")
+_USER_RE = re.compile(r"@\w+(\.\w+)?")
+_WS_RE = re.compile(r"\s+")
+_ANCHOR_RE = re.compile(r"[^\w-]")
+# Valid last characters for each character a JSON document can start with,
+# including the NaN/Infinity literals json.loads accepts
+_DIGITS = "0123456789"
+_JSON_BOUNDS = {
+    "{": "}",
+    "[": "]",
+    '"': '"',
+    "-": _DIGITS + "y",
+    "t": "e",
+    "f": "e",
+    "n": "l",
+    "N": "N",
+    "I": "y",
+    **dict.fromkeys(_DIGITS, _DIGITS),
+}
+
+_DATE_FORMAT_MS = "%Y-%m-%dT%H:%M:%S.%fZ"
+_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+@lru_cache(maxsize=2048)
 def clean_name(text):
     """Clean the display name.
 
@@ -36,11 +62,34 @@ def create_contents(input_array: List[str]) -> str:
         str: The markdown table of contents.
 
     """
-    markdown_links = []
-    for item in input_array:
-        anchor = re.sub(r"[^\w-]", "", item.replace(" ", "-")).lower()
-        markdown_links.append(f"- [{item}](#{anchor})\n")
-    return "".join(markdown_links)
+    return "".join(
+        f"- [{item}](#{_ANCHOR_RE.sub('', item.replace(' ', '-')).lower()})\n"
+        for item in input_array
+    )
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(date: str) -> Optional[datetime.datetime]:
+    """Parse an API date string, picking the format up front instead of trying each in turn.
+
+    Args:
+        date (str): Date string in the format "%Y-%m-%dT%H:%M:%S.%fZ" or "%Y-%m-%dT%H:%M:%SZ".
+
+    Returns:
+        Optional[datetime.datetime]: The parsed date, or None if the string is in neither format.
+    """
+    date_format = _DATE_FORMAT_MS if "." in date else _DATE_FORMAT
+    try:
+        return datetime.datetime.strptime(date, date_format)
+    except ValueError:
+        return None
+
+
+def _format_datetime(date: datetime.datetime) -> str:
+    """Format a datetime as "%d-%m-%Y %H:%M" without going through strftime."""
+    return (
+        f"{date.day:02d}-{date.month:02d}-{date.year} {date.hour:02d}:{date.minute:02d}"
+    )
 
 
 def format_date(date) -> str:
@@ -53,21 +102,15 @@ def format_date(date) -> str:
         str: Human-readable date string in the format "%d-%m-%Y %H:%M"
     """
     if isinstance(date, str):
-        try:
-            date_obj = datetime.datetime.strptime(date, "%Y-%m-%dT%H:%M:%S.%fZ")
-            return date_obj.strftime("%d-%m-%Y %H:%M")
-        except ValueError:
-            try:
-                date_obj = datetime.datetime.strptime(date, "%Y-%m-%dT%H:%M:%SZ")
-                return date_obj.strftime("%d-%m-%Y %H:%M")
-            except ValueError:
-                log.warning("Invalid modified date format: %s", date)
-                return date
-    elif isinstance(date, datetime.datetime):
-        return date.strftime("%d-%m-%Y %H:%M")
-    else:
-        log.warning("Invalid date format: %s", date)
-        return str(date)
+        date_obj = _parse_date(date)
+        if date_obj is None:
+            log.warning("Invalid modified date format: %s", date)
+            return date
+        return _format_datetime(date_obj)
+    if isinstance(date, datetime.datetime):
+        return _format_datetime(date)
+    log.warning("Invalid date format: %s", date)
+    return str(date)
 
 
 def clean_string(string: str, min_length: int) -> str:
@@ -75,19 +118,23 @@ def clean_string(string: str, min_length: int) -> str:
     if not string:
         return ""
 
-    string = re.sub(r"<[^>]*?>", "", string)  # Remove HTML tags
-    string = re.sub(r"http[s]?://\S+", "", string)  # Remove URLs
-    string = re.sub(r"@\w+(\.\w+)?", "", string)  # Remove user references
+    string = _TAG_RE.sub("", string)  # Remove HTML tags
+    string = _URL_RE.sub("", string)  # Remove URLs
+    string = _USER_RE.sub("", string)  # Remove user references
 
-    try:
-        json.loads(string)
-        string = ""
-    except json.JSONDecodeError:
-        pass
-
-    string = string.strip()
-    string = re.sub(r"&nbsp;", " ", string)
-    string = re.sub(r"\s+", " ", string)
+    stripped = string.strip()
+
+    # Only attempt to parse strings shaped like JSON, plain text is the common case
+    if stripped and stripped[-1] in _JSON_BOUNDS.get(stripped[0], ""):
+        try:
+            json.loads(string)
+            stripped = ""
+        except json.JSONDecodeError:
+            pass
+
+    string = stripped
+    string = string.replace("&nbsp;", " ")
+    string = _WS_RE.sub(" ", string)
 
     if len(string) < min_length:
         log.debug("String is shorter than %d characters: %s", min_length, string)
@@ -1,7 +1,8 @@
 """Work module for changelog-weaver"""
 
-from typing import Dict, List, Union, Optional
+from typing import Any, Callable, Dict, List, Union, Optional
 import asyncio
+import json
 import time
 from .configuration import Config
 from .typings import (
@@ -25,6 +26,45 @@ from .logger import get_logger
 log = get_logger(__name__)
 
 
+def _create_devops_client(config: Config) -> PlatformClient:
+    platform = config.project.platform
+    return DevOpsPlatformClient(
+        DevOpsConfig(
+            url=platform.base_url,
+            org=platform.organization,
+            project=config.project.ref,
+            query=platform.query,
+            pat=platform.access_token,
+            repo_name=platform.repo_name,
+        )
+    )
+
+
+def _create_github_client(config: Config) -> PlatformClient:
+    platform = config.project.platform
+    log.info(
+        f"Creating GitHub client with branch: {platform.branch}, "
+        f"from_tag: {platform.from_tag}, to_tag: {platform.to_tag}"
+    )
+    return GitHubPlatformClient(
+        GitHubConfig(
+            access_token=platform.access_token,
+            repo_name=config.project.ref,
+            branch=platform.branch,
+            from_tag=platform.from_tag,
+            to_tag=platform.to_tag,
+        )
+    )
+
+
+# Client factory for each supported platform
+_PLATFORM_CLIENT_FACTORIES: Dict[Platform, Callable[[Config], PlatformClient]] = {
+    Platform.AZURE_DEVOPS: _create_devops_client,
+    Platform.GITHUB: _create_github_client,
+}
+
+
+# pylint: disable=too-many-instance-attributes
 class Work:
     """Class for fetching and summarizing work items from the platform."""
 
@@ -34,55 +74,38 @@ class Work:
         self.root_items: List[HierarchicalWorkItem] = []
         self.by_type: List[WorkItemGroup] = []
         self.item_ids: List[int] = []
+        # Orphaned items in the order they were added, kept up to date by add()
+        self._orphans: Dict[int, HierarchicalWorkItem] = {}
         self.platform = config.project.platform
+        self._platform_kind = self.platform.platform
         self.client = self._create_platform_client(config)
 
     def _create_platform_client(self, config: Config) -> PlatformClient:
-        if self.platform.platform == Platform.AZURE_DEVOPS:
-            return DevOpsPlatformClient(
-                DevOpsConfig(
-                    url=config.project.platform.base_url,
-                    org=config.project.platform.organization,
-                    project=config.project.ref,
-                    query=config.project.platform.query,
-                    pat=config.project.platform.access_token,
-                    repo_name=config.project.platform.repo_name,
-                )
-            )
-        if self.platform.platform == Platform.GITHUB:
-            log.info(
-                f"Creating GitHub client with branch: {config.project.platform.branch}, "
-                f"from_tag: {config.project.platform.from_tag}, to_tag: {config.project.platform.to_tag}"
-            )
-            return GitHubPlatformClient(
-                GitHubConfig(
-                    access_token=config.project.platform.access_token,
-                    repo_name=config.project.ref,
-                    branch=config.project.platform.branch,
-                    from_tag=config.project.platform.from_tag,
-                    to_tag=config.project.platform.to_tag,
-                )
-            )
-        raise ValueError(f"Unsupported platform: {self.platform}")
+        factory = _PLATFORM_CLIENT_FACTORIES.get(self._platform_kind)
+        if factory is None:
+            raise ValueError(f"Unsupported platform: {self.platform}")
+        return factory(config)
 
     async def initialize(self):
         """Initialize the platform client."""
         log.info("Initializing Work class")
-        start_time = time.time()
+        start_time = time.perf_counter()
         await self.client.initialize()
-        end_time = time.time()
-        log.info(f"Work class initialized in {end_time - start_time} seconds")
+        end_time = time.perf_counter()
+        log.info("Work class initialized in %.2f seconds", end_time - start_time)
 
     async def close(self):
-        """Close the platform client."""
+        """Close the platform client and the model."""
         await self.client.close()
+        await self.config.model.close()
 
     async def summarize_work_item(self, wi: WorkItem) -> WorkItem:
         """
         Summarize a work item.
 
-        This method skips summarization for commit items and only processes
-        other types of work items if summarization is enabled in the configuration.
+        This method skips summarization for commit items and for items with no
+        description or comments, and only processes other types of work items if
+        summarization is enabled in the configuration.
 
         Args:
             wi (WorkItem): The work item to summarize.
@@ -98,6 +121,11 @@ class Work:
             log.info("Skipping work item summary due to configuration setting")
             return wi
 
+        # Without a description or comments the model can only restate the title
+        if not (wi.description or wi.comments):
+            log.debug("Skipping summary for work item %s without content", wi.id)
+            return wi
+
         log.info(f"Summarizing work item {wi.id}")
         item_prompt: str = self.config.prompts.item
         prompt = f"{item_prompt}: {wi.title} item type: {wi.type} {wi.description} {wi.comments}"
@@ -114,15 +142,38 @@ class Work:
         prompt = (
             f"{software_prompt}{software_brief}\n"
             f"The following is a summary of the work items completed in this release:\n"
-            f"{changelog}\nYour response should be as concise as possible"
+            f"{self._serialize_changelog(changelog)}\n"
+            "Your response should be as concise as possible"
         )
         return await self.config.model.summarise(prompt)
 
+    @classmethod
+    def _serialize_changelog(cls, changelog: List[HierarchicalWorkItem]) -> str:
+        """Serialize the changelog items to compact JSON for the summary prompt."""
+        return json.dumps(
+            [cls._compact_item(item) for item in changelog],
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def _compact_item(cls, item: HierarchicalWorkItem) -> Dict[str, Any]:
+        """Reduce a work item to the fields the changelog summary needs."""
+        compact: Dict[str, Any] = {"type": item.type, "title": item.title}
+        details = item.summary or item.description
+        if details:
+            compact["details"] = details
+        if item.children:
+            compact["children"] = [cls._compact_item(child) for child in item.children]
+        return compact
+
     def add(self, work_item: WorkItem) -> HierarchicalWorkItem:
         """Add a work item to the collection."""
         if work_item.id not in self.all:
-            hierarchical_item = HierarchicalWorkItem(**work_item.__dict__)
+            hierarchical_item = HierarchicalWorkItem.from_work_item(work_item)
             self.all[work_item.id] = hierarchical_item
+            if hierarchical_item.orphan and hierarchical_item.id != 0:
+                self._orphans[hierarchical_item.id] = hierarchical_item
         return self.all[work_item.id]
 
     async def get_item_by_id(self, item_id: Union[int, str]) -> HierarchicalWorkItem:
@@ -143,34 +194,29 @@ class Work:
             List[HierarchicalWorkItem]: A list of work items with their details.
         """
         log.info("Starting to fetch work items with details")
-        start_time = time.time()
+        start_time = time.perf_counter()
         items = await self.client.get_work_items_with_details(**kwargs)
-        if self.platform.platform == Platform.GITHUB:
+        if self._platform_kind == Platform.GITHUB:
             self.root_items = [self.add(item) for item in items]
             for root_item in self.root_items:
                 for child in root_item.children:
                     self.all[child.id] = child
                     self.item_ids.append(child.id)
+            await self._summarize_items()
         else:  # Azure DevOps
             self.item_ids = [item.id for item in items]
             log.info("Fetched %s work items from client", len(items))
-            add_tasks = [self.get_item_by_id(item.id) for item in items]
-            await asyncio.gather(*add_tasks)
-            log.info("Added %s items to the work item collection", len(add_tasks))
-            await self._fetch_parents()
+            for item in items:
+                self.add(item)
+            log.info("Added %s items to the work item collection", len(items))
+            # Summaries only cover the fetched items, so they can run while the
+            # parents are being fetched
+            await asyncio.gather(self._fetch_parents(), self._summarize_items())
             log.info("Fetched parent items")
             self._create_other_parent()
             log.info("Created 'Other' parent for orphaned items")
 
-        if self.config.model.item_summary:
-            summary_tasks = [
-                self.summarize_work_item(item)
-                for item in self.all.values()
-                if item.id in self.item_ids and item.type.lower() != "commit"
-            ]
-            await asyncio.gather(*summary_tasks)
-
-        if self.platform.platform == Platform.AZURE_DEVOPS:
+        if self._platform_kind == Platform.AZURE_DEVOPS:
             hierarchy = Hierarchy(self.all)
             self.root_items = hierarchy.root_items
             self.by_type = hierarchy.by_type
@@ -184,12 +230,24 @@ class Work:
 
         log.info(f"Total root items: {len(self.root_items)}")
         log.info(f"Total by_type groups: {len(self.by_type)}")
-        end_time = time.time()
+        end_time = time.perf_counter()
         log.info(
             "Fetched and processed work items in %.2f seconds", end_time - start_time
         )
         return self.root_items
 
+    async def _summarize_items(self):
+        """Summarize the fetched work items, skipping commits."""
+        if not self.config.model.item_summary:
+            return
+        item_ids = set(self.item_ids)
+        summary_tasks = [
+            self.summarize_work_item(item)
+            for item in self.all.values()
+            if item.id in item_ids and item.type.lower() != "commit"
+        ]
+        await asyncio.gather(*summary_tasks)
+
     def _convert_commit_to_work_item(self, commit: CommitInfo) -> HierarchicalWorkItem:
         """
         Convert a CommitInfo object to a HierarchicalWorkItem.
@@ -216,32 +274,33 @@ class Work:
         )
 
     async def _fetch_parents(self):
-        if self.platform.platform != Platform.AZURE_DEVOPS:
+        if self._platform_kind != Platform.AZURE_DEVOPS:
             return
         log.info("Starting to fetch parent items")
-        start_time = time.time()
-        items_to_fetch = set()
-        items_list = list(self.all.values())
-        for item in items_list:
-            current_item = item
-            while current_item.parent_id and current_item.parent_id not in self.all:
-                items_to_fetch.add(current_item.parent_id)
-                current_item = await self.get_item_by_id(current_item.parent_id)
-        log.info(f"Fetching {len(items_to_fetch)} parent items")
-        batch_size = 10
-        for i in range(0, len(items_to_fetch), batch_size):
-            batch = list(items_to_fetch)[i : i + batch_size]
-            parent_fetch_tasks = [self.get_item_by_id(parent_id) for parent_id in batch]
-            await asyncio.gather(*parent_fetch_tasks)
-        end_time = time.time()
-        log.info(f"Fetched parent items in {end_time - start_time:.2f} seconds")
+        start_time = time.perf_counter()
+        # Fetch one level of missing ancestors per request, until none are missing
+        fetched_count = 0
+        new_items = self.all.values()
+        while True:
+            missing_ids = {
+                item.parent_id
+                for item in new_items
+                if item.parent_id and item.parent_id not in self.all
+            }
+            if not missing_ids:
+                break
+            new_items = await self.client.get_work_items_by_ids(list(missing_ids))
+            for item in new_items:
+                self.add(item)
+            fetched_count += len(new_items)
+        log.info(f"Fetched {fetched_count} parent items")
+        end_time = time.perf_counter()
+        log.info("Fetched parent items in %.2f seconds", end_time - start_time)
 
     def _create_other_parent(self):
-        if self.platform.platform == Platform.GITHUB:
+        if self._platform_kind == Platform.GITHUB:
             return  # GitHub doesn't need an "Other" parent
-        orphaned_items = [
-            item for item in self.all.values() if item.orphan and item.id != 0
-        ]
+        orphaned_items = list(self._orphans.values())
         if orphaned_items:
             log.info("Creating 'Other' work item for orphaned items")
             other_parent = HierarchicalWorkItem(
@@ -268,7 +327,7 @@ class Work:
             List[WorkItemGroup]: A list of ordered work item groups.
         """
         log.info("Generating ordered work items")
-        start_time = time.time()
+        start_time = time.perf_counter()
         if not self.by_type:
             await self.get_items_with_details()
 
@@ -290,8 +349,8 @@ class Work:
             self.by_type.append(commits_group)
             log.info(f"Added commits group with {len(commit_items)} commits")
 
-        end_time = time.time()
-        log.info(f"Generated ordered work items in {end_time - start_time:.2f} seconds")
+        end_time = time.perf_counter()
+        log.info("Generated ordered work items in %.2f seconds", end_time - start_time)
         return self.by_type
 
     def get_work_item_types(self) -> List[WorkItemType]: